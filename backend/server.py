@@ -7,6 +7,7 @@ from pyzbar.pyzbar import decode
 import pytesseract
 import numpy as np
 import os
+import json
 from datetime import datetime
 import time
 
@@ -24,6 +25,14 @@ student_queue = queue.Queue()
 latest_frame = None
 frame_lock = threading.Lock()
 
+# Overlay metadata for the latest frame (drawn client-side by React)
+latest_overlay = None
+overlay_lock = threading.Lock()
+frame_seq = 0
+
+# Burn overlays into the JPEG on the server as well (off by default)
+DRAW_OVERLAYS = os.environ.get('DRAW_OVERLAYS', '0') == '1'
+
 # Camera scanning state
 camera_running = False
 camera_thread = None
@@ -121,9 +130,48 @@ def detect_student_photo(frame):
     return None
 
 
+def draw_overlays(frame, overlay):
+    """Rasterize overlay metadata onto the frame (only used when DRAW_OVERLAYS is set)"""
+    if overlay['photo']:
+        px, py, pw, ph = overlay['photo']
+        cv2.rectangle(frame, (px, py), (px + pw, py + ph), (255, 0, 255), 2)
+        cv2.putText(frame, "Photo", (px, py - 10),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 255), 2)
+
+    for item in overlay['barcodes']:
+        x, y, w, h = item['rect']
+        if item['state'] == 'reading':
+            color = (0, 165, 255)
+            label = f"Reading... ({item['reads']}/{item['threshold']})"
+            scale = 0.6
+        elif item['state'] == 'already_scanned':
+            color = (0, 165, 255)
+            label = f"{item['name']} (ALREADY SCANNED)"
+            scale = 0.6
+        else:
+            color = (0, 255, 0)
+            label = item['name']
+            scale = 0.7
+        cv2.rectangle(frame, (x, y), (x + w, y + h), color, 2)
+        cv2.putText(frame, label, (x, y - 30),
+                    cv2.FONT_HERSHEY_SIMPLEX, scale, color, 2)
+        cv2.putText(frame, f"ID: {item['id']}", (x, y - 10),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
+
+    if overlay['last']:
+        cv2.putText(frame, f"Last scanned: {overlay['last']['name']}", (10, 30),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
+        cv2.putText(frame, f"ID: {overlay['last']['id']}", (10, 60),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 2)
+
+    cv2.putText(frame, f"Unique students: {overlay['unique']}", (10, 90),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
+
+
 def camera_scan_loop():
     """Main camera scanning loop running in background thread"""
-    global latest_frame, last_barcode_data, last_student_name, last_scan_time, camera_running
+    global latest_frame, latest_overlay, frame_seq
+    global last_barcode_data, last_student_name, last_scan_time, camera_running
     
     cap = cv2.VideoCapture(0)
     
@@ -144,12 +192,8 @@ def camera_scan_loop():
         barcodes = decode(frame)
         photo_rect = detect_student_photo(frame)
 
-        # Draw photo rectangle if detected
-        if photo_rect:
-            px, py, pw, ph = photo_rect
-            cv2.rectangle(frame, (px, py), (px + pw, py + ph), (255, 0, 255), 2)
-            cv2.putText(frame, "Photo", (px, py - 10),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 255), 2)
+        # Collect detection results; the frame itself stays clean
+        barcode_overlays = []
 
         # Process barcodes
         for barcode in barcodes:
@@ -174,13 +218,15 @@ def camera_scan_loop():
                 
                 # Only proceed if we've hit the threshold
                 if unknown_read_count[barcode_data] < UNKNOWN_THRESHOLD:
-                    # Draw barcode but don't process
-                    x, y, w, h = barcode.rect
-                    cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 165, 255), 2)
-                    cv2.putText(frame, f"Reading... ({unknown_read_count[barcode_data]}/{UNKNOWN_THRESHOLD})", 
-                               (x, y - 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 165, 255), 2)
-                    cv2.putText(frame, f"ID: {barcode_data}", (x, y - 10),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 165, 255), 2)
+                    # Show barcode but don't process
+                    barcode_overlays.append({
+                        'rect': list(barcode.rect),
+                        'id': barcode_data,
+                        'name': student_name,
+                        'state': 'reading',
+                        'reads': unknown_read_count[barcode_data],
+                        'threshold': UNKNOWN_THRESHOLD
+                    })
                     continue
                 else:
                     # After 15 reads, accept as unknown
@@ -191,17 +237,14 @@ def camera_scan_loop():
                 if barcode_data in unknown_read_count:
                     del unknown_read_count[barcode_data]
 
-            # Draw barcode rectangle and info
-            x, y, w, h = barcode.rect
-            
             # Check if already scanned and show appropriate visual feedback
             if already_scanned:
-                # Yellow/orange color for already scanned students
-                cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 165, 255), 2)
-                cv2.putText(frame, f"{student_name} (ALREADY SCANNED)", (x, y - 30),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 165, 255), 2)
-                cv2.putText(frame, f"ID: {barcode_data}", (x, y - 10),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 165, 255), 2)
+                barcode_overlays.append({
+                    'rect': list(barcode.rect),
+                    'id': barcode_data,
+                    'name': student_name,
+                    'state': 'already_scanned'
+                })
             else:
                 # Check if this is a new scan (cooldown period)
                 if name_is_valid and (student_name != last_student_name or 
@@ -232,23 +275,34 @@ def camera_scan_loop():
                         cv2.imwrite(filename, photo_crop)
                         print(f"📸 Saved student photo: {filename}")
 
-                # Green color for new/valid students
-                cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
-                cv2.putText(frame, student_name, (x, y - 30),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-                cv2.putText(frame, f"ID: {barcode_data}", (x, y - 10),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-
-        # Draw last scanned info and total count
-        if last_student_name:
-            cv2.putText(frame, f"Last scanned: {last_student_name}", (10, 30),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
-            cv2.putText(frame, f"ID: {last_barcode_data}", (10, 60),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 2)
-        
-        # Draw total unique students scanned
-        cv2.putText(frame, f"Unique students: {len(scanned_students)}", (10, 90),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
+                barcode_overlays.append({
+                    'rect': list(barcode.rect),
+                    'id': barcode_data,
+                    'name': student_name,
+                    'state': 'valid'
+                })
+
+        frame_seq += 1
+        overlay = {
+            'seq': frame_seq,
+            'width': frame.shape[1],
+            'height': frame.shape[0],
+            'photo': list(photo_rect) if photo_rect else None,
+            'barcodes': barcode_overlays,
+            'last': {
+                'name': last_student_name,
+                'id': last_barcode_data
+            } if last_student_name else None,
+            'unique': len(scanned_students),
+            'rasterized': DRAW_OVERLAYS
+        }
+
+        # Publish overlay metadata as soon as detection is done
+        with overlay_lock:
+            latest_overlay = json.dumps(overlay, separators=(',', ':')).encode('utf-8')
+
+        if DRAW_OVERLAYS:
+            draw_overlays(frame, overlay)
 
         # Encode frame as JPEG and store
         _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
@@ -309,6 +363,16 @@ def get_camera_feed():
             return Response(status=204)
 
 
+@app.route('/api/camera-overlay', methods=['GET'])
+def get_camera_overlay():
+    """Send overlay metadata for the latest frame (drawn on a canvas by React)"""
+    with overlay_lock:
+        if latest_overlay:
+            return Response(latest_overlay, mimetype='application/json')
+        else:
+            return Response(status=204)
+
+
 @app.route('/api/get-latest-scan', methods=['GET'])
 def get_latest_scan():
     """Poll for latest scanned student (used by React frontend)"""
@@ -11,9 +11,11 @@ function App() {
   const [draggedDesk, setDraggedDesk] = useState(null);
   const [dragOffset, setDragOffset] = useState({ x: 0, y: 0 });
   const [cameraFeed, setCameraFeed] = useState(null);
+  const [cameraOverlay, setCameraOverlay] = useState(null);
   const [lastScanned, setLastScanned] = useState(null);
   const [scannerStatus, setScannerStatus] = useState('disconnected');
   const canvasRef = useRef(null);
+  const overlayCanvasRef = useRef(null);
 
   // Create a new classroom
   const createClassroom = () => {
@@ -215,15 +217,97 @@ function App() {
       }
     }, 100); // Update camera feed 10 times per second
 
+    // Poll for overlay metadata (barcodes, photo box, scan info)
+    const overlayPollInterval = setInterval(async () => {
+      try {
+        const response = await fetch('http://localhost:5000/api/camera-overlay');
+        if (response.ok && response.status === 200) {
+          const overlay = await response.json();
+          
+          // Only re-render when the server has processed a new frame
+          setCameraOverlay(prevOverlay =>
+            prevOverlay && prevOverlay.seq === overlay.seq ? prevOverlay : overlay
+          );
+        }
+      } catch (error) {
+        // Overlay not available
+      }
+    }, 50); // Overlays follow detection rate, not video frame rate
+
     return () => {
       clearInterval(scanPollInterval);
       clearInterval(cameraPollInterval);
+      clearInterval(overlayPollInterval);
       if (cameraFeed) {
         URL.revokeObjectURL(cameraFeed);
       }
     };
   }, [activeClassroom]);
 
+  // Draw camera overlays on top of the video feed
+  useEffect(() => {
+    const canvas = overlayCanvasRef.current;
+    if (!canvas) return;
+    
+    const ctx = canvas.getContext('2d');
+    canvas.width = canvas.clientWidth;
+    canvas.height = canvas.clientHeight;
+    ctx.clearRect(0, 0, canvas.width, canvas.height);
+    
+    // Server already burned overlays into the frame
+    if (!cameraOverlay || cameraOverlay.rasterized) return;
+    
+    // Match the image's object-fit: cover scaling
+    const scale = Math.max(canvas.width / cameraOverlay.width, canvas.height / cameraOverlay.height);
+    const offsetX = (canvas.width - cameraOverlay.width * scale) / 2;
+    const offsetY = (canvas.height - cameraOverlay.height * scale) / 2;
+    
+    const drawBox = ([x, y, w, h], color) => {
+      ctx.strokeStyle = color;
+      ctx.lineWidth = 2;
+      ctx.strokeRect(offsetX + x * scale, offsetY + y * scale, w * scale, h * scale);
+    };
+    
+    const drawText = (text, x, y, size, color) => {
+      ctx.font = `bold ${Math.max(9, size * scale)}px sans-serif`;
+      ctx.fillStyle = color;
+      ctx.fillText(text, offsetX + x * scale, offsetY + y * scale);
+    };
+    
+    if (cameraOverlay.photo) {
+      const [px, py] = cameraOverlay.photo;
+      drawBox(cameraOverlay.photo, '#ff00ff');
+      drawText('Photo', px, py - 10, 11, '#ff00ff');
+    }
+    
+    cameraOverlay.barcodes.forEach(barcode => {
+      const [x, y] = barcode.rect;
+      let color = '#00ff00';
+      let label = barcode.name;
+      
+      if (barcode.state === 'reading') {
+        color = '#ffa500';
+        label = `Reading... (${barcode.reads}/${barcode.threshold})`;
+      } else if (barcode.state === 'already_scanned') {
+        color = '#ffa500';
+        label = `${barcode.name} (ALREADY SCANNED)`;
+      }
+      
+      drawBox(barcode.rect, color);
+      drawText(label, x, y - 30, 14, color);
+      drawText(`ID: ${barcode.id}`, x, y - 10, 11, color);
+    });
+    
+    // Screen-space info (not scaled with the frame)
+    ctx.font = 'bold 11px sans-serif';
+    ctx.fillStyle = '#00ffff';
+    if (cameraOverlay.last) {
+      ctx.fillText(`Last scanned: ${cameraOverlay.last.name}`, 6, 16);
+      ctx.fillText(`ID: ${cameraOverlay.last.id}`, 6, 30);
+    }
+    ctx.fillText(`Unique students: ${cameraOverlay.unique}`, 6, 44);
+  }, [cameraOverlay, cameraFeed]);
+
   // Simulate receiving data from Python script (for testing)
   const simulateStudentScan = () => {
     if (!activeClassroom) {
@@ -368,7 +452,10 @@ function App() {
             </h3>
             <div className="camera-feed">
               {cameraFeed ? (
-                <img src={cameraFeed} alt="Camera feed" className="camera-image" />
+                <>
+                  <img src={cameraFeed} alt="Camera feed" className="camera-image" />
+                  <canvas ref={overlayCanvasRef} className="camera-overlay" />
+                </>
               ) : (
                 <div className="camera-placeholder">
                   <Camera size={48} />